@@ -1,4 +1,5 @@
 import asyncio
+import os
 import random
 from asyncio import AbstractEventLoop
 from collections.abc import AsyncGenerator
@@ -64,9 +65,15 @@ def cli_args(
 
 @pytest.fixture(autouse=True, scope="session")
 def _init_observability() -> None:
+    # Each pytest-xdist worker process runs its own metrics server
+    metrics_port = 8080
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker_id is not None:
+        metrics_port += int(worker_id.removeprefix("gw")) + 1
+
     init_observability(
         metrics_address="localhost",
-        metrics_port=8080,
+        metrics_port=metrics_port,
         metrics_multiprocess_mode=False,
         log_level="DEBUG",
     )
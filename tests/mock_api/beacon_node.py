@@ -15,6 +15,8 @@ from spec import SpecAttestation, SpecBeaconBlock, SpecSyncCommittee
 from spec.attestation import AttestationData, Checkpoint
 from spec.base import Fork, Genesis, SpecDeneb
 
+_json_encoder = msgspec.json.Encoder()
+
 
 @pytest.fixture(scope="session")
 def beacon_node_url() -> str:
@@ -26,11 +28,16 @@ def execution_payload_blinded(request: pytest.FixtureRequest) -> bool:
     return getattr(request, "param", False)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _beacon_block_class_init(spec_deneb: SpecDeneb) -> None:
     SpecBeaconBlock.initialize(spec=spec_deneb)
 
 
+@pytest.fixture(scope="session")
+def empty_beacon_block(_beacon_block_class_init: None) -> dict:  # type: ignore[type-arg]
+    return SpecBeaconBlock.Deneb().to_obj()  # type: ignore[no-any-return]
+
+
 @pytest.fixture
 def _sync_committee_contribution_class_init(spec_deneb: SpecDeneb) -> None:
     SpecSyncCommittee.initialize(spec=spec_deneb)
@@ -62,6 +69,36 @@ def mocked_genesis_response() -> dict:  # type: ignore[type-arg]
     )
 
 
+_BEACON_NODE_INIT_ENDPOINTS = (
+    "/eth/v1/beacon/genesis",
+    "/eth/v1/config/spec",
+    "/eth/v1/node/version",
+)
+
+
+def mock_beacon_node_init_endpoints(
+    m: aioresponses,
+    base_urls: list[str],
+    genesis_response: dict,  # type: ignore[type-arg]
+    spec: SpecDeneb,
+    repeat: bool = True,
+) -> None:
+    """Mocks the endpoints a beacon node queries during its initialization."""
+    # Encode the responses once, aioresponses would otherwise
+    # serialize the payload again for every mocked request
+    bodies = [
+        _json_encoder.encode(payload)
+        for payload in (
+            genesis_response,
+            dict(data=spec.to_obj()),
+            dict(data=dict(version="vero/test")),
+        )
+    ]
+    for base_url in base_urls:
+        for endpoint, body in zip(_BEACON_NODE_INIT_ENDPOINTS, bodies, strict=True):
+            m.get(url=f"{base_url}{endpoint}", body=body, repeat=repeat)
+
+
 @pytest.fixture
 def _mocked_beacon_node_endpoints(
     validators: list[ValidatorIndexPubkey],
@@ -90,7 +127,7 @@ def _mocked_beacon_node_endpoints(
             epoch_no = int(url.raw_path.split("/")[-1])
 
             return CallbackResult(
-                body=msgspec.json.encode(
+                body=_json_encoder.encode(
                     SchemaBeaconAPI.GetProposerDutiesResponse(
                         dependent_root="0xab09edd9380f8451c3ff5c809821174a36dce606fea8b5ea35ea936915dbf889",
                         execution_optimistic=False,
@@ -135,7 +172,7 @@ def _mocked_beacon_node_endpoints(
                 consensus_block_value=str(random.randint(0, 10_000_000)),
                 data=_data,
             )
-            return CallbackResult(body=msgspec.json.encode(response))
+            return CallbackResult(body=_json_encoder.encode(response))
 
         if re.match("/eth/v1/validator/attestation_data", url.raw_path):
             att_data = AttestationData(
@@ -170,7 +207,7 @@ def _mocked_beacon_node_endpoints(
 
         if re.match("/eth/v1/beacon/blocks/head/root", url.raw_path):
             return CallbackResult(
-                body=msgspec.json.encode(
+                body=_json_encoder.encode(
                     SchemaBeaconAPI.GetBlockRootResponse(
                         execution_optimistic=False,
                         data=SchemaBeaconAPI.BlockRoot(
@@ -207,7 +244,7 @@ def _mocked_beacon_node_endpoints(
             statuses = data["statuses"]
 
             return CallbackResult(
-                body=msgspec.json.encode(
+                body=_json_encoder.encode(
                     SchemaBeaconAPI.GetStateValidatorsResponse(
                         execution_optimistic=False,
                         data=[
@@ -274,7 +311,7 @@ def _mocked_beacon_node_endpoints(
                 )
 
             return CallbackResult(
-                body=msgspec.json.encode(
+                body=_json_encoder.encode(
                     SchemaBeaconAPI.GetAttesterDutiesResponse(
                         dependent_root="0xab09edd9380f8451c3ff5c809821174a36dce606fea8b5ea35ea936915dbf889",
                         execution_optimistic=False,
@@ -307,7 +344,7 @@ def _mocked_beacon_node_endpoints(
             ]
 
             return CallbackResult(
-                body=msgspec.json.encode(
+                body=_json_encoder.encode(
                     SchemaBeaconAPI.GetSyncDutiesResponse(
                         execution_optimistic=False,
                         data=sync_duties,
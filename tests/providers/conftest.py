@@ -1,68 +1,56 @@
-import re
 from collections.abc import AsyncGenerator
 
+import msgspec
 import pytest
-from aioresponses import CallbackResult, aioresponses
+from aioresponses import aioresponses
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-from args import CLIArgs
+from args import CLIArgs, _process_attestation_consensus_threshold
 from providers import MultiBeaconNode
 from spec.base import SpecDeneb
 from tasks import TaskManager
+from tests.mock_api.beacon_node import mock_beacon_node_init_endpoints
+
+
+@pytest.fixture
+def attestation_consensus_threshold(request: pytest.FixtureRequest) -> int | None:
+    return getattr(request, "param", None)
 
 
 @pytest.fixture
 async def multi_beacon_node_three_inited_nodes(
-    mocked_fork_response: dict,  # type: ignore[type-arg]
     mocked_genesis_response: dict,  # type: ignore[type-arg]
     spec_deneb: SpecDeneb,
     scheduler: AsyncIOScheduler,
     task_manager: TaskManager,
     cli_args: CLIArgs,
+    attestation_consensus_threshold: int | None,
 ) -> AsyncGenerator[MultiBeaconNode, None]:
+    beacon_node_urls = [
+        "http://beacon-node-a:1234",
+        "http://beacon-node-b:1234",
+        "http://beacon-node-c:1234",
+    ]
     mbn = MultiBeaconNode(
-        beacon_node_urls=[
-            "http://beacon-node-a:1234",
-            "http://beacon-node-b:1234",
-            "http://beacon-node-c:1234",
-        ],
+        beacon_node_urls=beacon_node_urls,
         beacon_node_urls_proposal=[],
         spec=spec_deneb,
         scheduler=scheduler,
         task_manager=task_manager,
-        cli_args=cli_args,
+        cli_args=msgspec.structs.replace(
+            cli_args,
+            attestation_consensus_threshold=_process_attestation_consensus_threshold(
+                attestation_consensus_threshold, beacon_node_urls
+            ),
+        ),
     )
     with aioresponses() as m:
-        m.get(
-            re.compile(r"http://beacon-node-\w:1234/eth/v1/beacon/states/head/fork"),
-            callback=lambda *args, **kwargs: CallbackResult(
-                payload=mocked_fork_response,
-            ),
-            repeat=True,
-        )
-        m.get(
-            re.compile(r"http://beacon-node-\w:1234/eth/v1/beacon/genesis"),
-            callback=lambda *args, **kwargs: CallbackResult(
-                payload=mocked_genesis_response,
-            ),
-            repeat=True,
-        )
-        m.get(
-            re.compile(r"http://beacon-node-\w:1234/eth/v1/config/spec"),
-            callback=lambda *args, **kwargs: CallbackResult(
-                payload=dict(data=spec_deneb.to_obj()),
-            ),
-            repeat=True,
-        )
-        m.get(
-            re.compile(r"http://beacon-node-\w:1234/eth/v1/node/version"),
-            callback=lambda *args, **kwargs: CallbackResult(
-                payload=dict(data=dict(version="vero/test")),
-            ),
-            repeat=True,
+        mock_beacon_node_init_endpoints(
+            m,
+            base_urls=beacon_node_urls,
+            genesis_response=mocked_genesis_response,
+            spec=spec_deneb,
         )
         await mbn.initialize()
     yield mbn
-    for beacon_node in mbn.beacon_nodes:
-        if not beacon_node.client_session.closed:
-            await beacon_node.client_session.close()
+    await mbn.__aexit__(None, None, None)
@@ -7,11 +7,11 @@ when multiple beacon nodes are provided to it. That includes:
 
 import os
 import re
-from functools import partial
 
+import msgspec
 import pytest
 from aiohttp.web_exceptions import HTTPRequestTimeout
-from aioresponses import CallbackResult, aioresponses
+from aioresponses import aioresponses
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from remerkleable.bitfields import Bitlist, Bitvector
 
@@ -21,6 +21,19 @@ from spec.attestation import AttestationData, SpecAttestation
 from spec.base import SpecDeneb
 from spec.sync_committee import SpecSyncCommittee
 from tasks import TaskManager
+from tests.mock_api.beacon_node import mock_beacon_node_init_endpoints
+
+_AGGREGATE_ATTESTATION_URL_RE = re.compile(
+    r"http://beacon-node-\w:1234/eth/v1/validator/aggregate_attestation",
+)
+_SYNC_COMMITTEE_CONTRIBUTION_URL_RE = re.compile(
+    r"http://beacon-node-\w:1234/eth/v1/validator/sync_committee_contribution",
+)
+
+# Request inputs shared by all parametrized cases, the mocked
+# beacon nodes do not depend on their values
+_ATTESTATION_DATA = AttestationData()
+_BEACON_BLOCK_ROOT = "0x" + os.urandom(32).hex()
 
 
 @pytest.mark.parametrize(
@@ -66,19 +79,22 @@ async def test_initialize(
     beacon_node_urls: list[str],
     beacon_node_availabilities: list[bool],
     expected_initialization_success: bool,
-    mocked_fork_response: dict,  # type: ignore[type-arg]
     mocked_genesis_response: dict,  # type: ignore[type-arg]
     spec_deneb: SpecDeneb,
     scheduler: AsyncIOScheduler,
     task_manager: TaskManager,
     cli_args: CLIArgs,
+    mocked_responses: aioresponses,
 ) -> None:
     """Tests that the multi-beacon node is able to initialize if enough
     of its supplied beacon nodes are available.
     """
     assert len(beacon_node_urls) == len(beacon_node_availabilities)
-    cli_args.attestation_consensus_threshold = _process_attestation_consensus_threshold(
-        None, beacon_node_urls
+    cli_args = msgspec.structs.replace(
+        cli_args,
+        attestation_consensus_threshold=_process_attestation_consensus_threshold(
+            None, beacon_node_urls
+        ),
     )
 
     mbn = MultiBeaconNode(
@@ -90,56 +106,34 @@ async def test_initialize(
         cli_args=cli_args,
     )
 
-    with aioresponses() as m:
-        for _url, beacon_node_available in zip(
-            beacon_node_urls,
-            beacon_node_availabilities,
-            strict=True,
-        ):
-            if beacon_node_available:
-                m.get(
-                    url=re.compile(
-                        r"http://beacon-node-\w:1234/eth/v1/beacon/states/head/fork",
-                    ),
-                    callback=lambda *args, **kwargs: CallbackResult(
-                        payload=mocked_fork_response,
-                    ),
-                )
-                m.get(
-                    url=re.compile(r"http://beacon-node-\w:1234/eth/v1/beacon/genesis"),
-                    callback=lambda *args, **kwargs: CallbackResult(
-                        payload=mocked_genesis_response,
-                    ),
-                )
-                m.get(
-                    url=re.compile(r"http://beacon-node-\w:1234/eth/v1/config/spec"),
-                    callback=lambda *args, **kwargs: CallbackResult(
-                        payload=dict(data=spec_deneb.to_obj()),
-                    ),
-                )
-                m.get(
-                    url=re.compile(r"http://beacon-node-\w:1234/eth/v1/node/version"),
-                    callback=lambda *args, **kwargs: CallbackResult(
-                        payload=dict(data=dict(version="vero/test")),
-                    ),
-                )
-            else:
-                # Fail the first request that is made during initialization
-                m.get(
-                    url=re.compile(
-                        r"http://beacon-node-\w:1234/eth/v1/beacon/states/head/fork",
-                    ),
-                    exception=ValueError("Beacon node unavailable"),
-                )
+    for url, beacon_node_available in zip(
+        beacon_node_urls,
+        beacon_node_availabilities,
+        strict=True,
+    ):
+        if beacon_node_available:
+            mock_beacon_node_init_endpoints(
+                mocked_responses,
+                base_urls=[url],
+                genesis_response=mocked_genesis_response,
+                spec=spec_deneb,
+                repeat=False,
+            )
+        else:
+            # Fail the first request that is made during initialization
+            mocked_responses.get(
+                url=f"{url}/eth/v1/beacon/genesis",
+                exception=ValueError("Beacon node unavailable"),
+            )
 
-        if expected_initialization_success:
+    if expected_initialization_success:
+        await mbn.initialize()
+    else:
+        with pytest.raises(
+            RuntimeError,
+            match="Failed to fully initialize a sufficient amount of beacon nodes",
+        ):
             await mbn.initialize()
-        else:
-            with pytest.raises(
-                RuntimeError,
-                match="Failed to fully initialize a sufficient amount of beacon nodes",
-            ):
-                await mbn.initialize()
 
     await mbn.__aexit__(None, None, None)
 
@@ -182,61 +176,54 @@ async def test_get_aggregate_attestation(
     best_aggregate_score: int,
     multi_beacon_node_three_inited_nodes: MultiBeaconNode,
     spec_deneb: SpecDeneb,
+    mocked_responses: aioresponses,
 ) -> None:
     """Tests that the multi-beacon requests aggregate attestations from all beacon nodes
     and returns the one with the highest value.
     """
-    with aioresponses() as m:
-        for number_of_attesting_indices in numbers_of_attesting_indices:
-            if isinstance(number_of_attesting_indices, int):
-                agg_bits_to_return = Bitlist[spec_deneb.MAX_VALIDATORS_PER_COMMITTEE](
-                    False for _ in range(spec_deneb.MAX_VALIDATORS_PER_COMMITTEE)
-                )
-                for idx in range(number_of_attesting_indices):
-                    agg_bits_to_return[idx] = True
-                _callback = partial(
-                    lambda _bits, *args, **kwargs: CallbackResult(
-                        payload=dict(
-                            data=SpecAttestation.AttestationDeneb(
-                                aggregation_bits=_bits,
-                            ).to_obj(),
-                        ),
-                    ),
-                    agg_bits_to_return,
-                )
-                m.get(
-                    url=re.compile(
-                        r"http://beacon-node-\w:1234/eth/v1/validator/aggregate_attestation",
-                    ),
-                    callback=_callback,
-                )
-            elif isinstance(number_of_attesting_indices, Exception):
-                m.get(
-                    url=re.compile(
-                        r"http://beacon-node-\w:1234/eth/v1/validator/aggregate_attestation",
-                    ),
-                    exception=number_of_attesting_indices,
-                )
-            else:
-                raise NotImplementedError
+    bitlist_size = spec_deneb.MAX_VALIDATORS_PER_COMMITTEE
+    # remerkleable creates a new class on every subscription
+    bitlist_type = Bitlist[bitlist_size]
 
-        if all(isinstance(n, Exception) for n in numbers_of_attesting_indices):
-            with pytest.raises(
-                RuntimeError,
-                match="Failed to get a response from all beacon nodes",
-            ):
-                _ = await multi_beacon_node_three_inited_nodes.get_aggregate_attestation(
-                    attestation_data=AttestationData(),
-                    committee_index=3,
-                )
+    for number_of_attesting_indices in numbers_of_attesting_indices:
+        if isinstance(number_of_attesting_indices, int):
+            agg_bits_to_return = bitlist_type(
+                [True] * number_of_attesting_indices
+                + [False] * (bitlist_size - number_of_attesting_indices)
+            )
+            mocked_responses.get(
+                url=_AGGREGATE_ATTESTATION_URL_RE,
+                payload=dict(
+                    data=SpecAttestation.AttestationDeneb(
+                        aggregation_bits=agg_bits_to_return,
+                    ).to_obj(),
+                ),
+            )
+        elif isinstance(number_of_attesting_indices, Exception):
+            mocked_responses.get(
+                url=_AGGREGATE_ATTESTATION_URL_RE,
+                exception=number_of_attesting_indices,
+            )
         else:
-            returned_aggregate = (
-                await multi_beacon_node_three_inited_nodes.get_aggregate_attestation(
-                    attestation_data=AttestationData(),
-                    committee_index=3,
-                )
+            raise NotImplementedError
+
+    if all(isinstance(n, Exception) for n in numbers_of_attesting_indices):
+        with pytest.raises(
+            RuntimeError,
+            match="Failed to get a response from all beacon nodes",
+        ):
+            _ = await multi_beacon_node_three_inited_nodes.get_aggregate_attestation(
+                attestation_data=_ATTESTATION_DATA,
+                committee_index=3,
             )
-            assert sum(returned_aggregate.aggregation_bits) == best_aggregate_score
+    else:
+        returned_aggregate = (
+            await multi_beacon_node_three_inited_nodes.get_aggregate_attestation(
+                attestation_data=_ATTESTATION_DATA,
+                committee_index=3,
+            )
+        )
+        assert sum(returned_aggregate.aggregation_bits) == best_aggregate_score
 
 
 @pytest.mark.parametrize(
@@ -278,64 +265,54 @@ async def test_get_sync_committee_contribution(
     best_contribution_score: int,
     multi_beacon_node_three_inited_nodes: MultiBeaconNode,
     spec_deneb: SpecDeneb,
+    mocked_responses: aioresponses,
 ) -> None:
     """Tests that the multi-beacon requests sync committee contributions from all beacon nodes
     and returns the one with the highest value.
     """
-    with aioresponses() as m:
-        for number_of_root_matching_indices in numbers_of_root_matching_indices:
-            if isinstance(number_of_root_matching_indices, int):
-                bitlist_size = (
-                    spec_deneb.SYNC_COMMITTEE_SIZE
-                    // spec_deneb.SYNC_COMMITTEE_SUBNET_COUNT
-                )
-                agg_bits_to_return = Bitvector[bitlist_size](
-                    False for _ in range(bitlist_size)
-                )
-                for idx in range(number_of_root_matching_indices):
-                    agg_bits_to_return[idx] = True
-                _callback = partial(
-                    lambda _bits, *args, **kwargs: CallbackResult(
-                        payload=dict(
-                            data=SpecSyncCommittee.Contribution(
-                                aggregation_bits=_bits,
-                            ).to_obj(),
-                        ),
-                    ),
-                    agg_bits_to_return,
-                )
-                m.get(
-                    url=re.compile(
-                        r"http://beacon-node-\w:1234/eth/v1/validator/sync_committee_contribution",
-                    ),
-                    callback=_callback,
-                )
-            elif isinstance(number_of_root_matching_indices, Exception):
-                m.get(
-                    url=re.compile(
-                        r"http://beacon-node-\w:1234/eth/v1/validator/sync_committee_contribution",
-                    ),
-                    exception=number_of_root_matching_indices,
-                )
-            else:
-                raise NotImplementedError
+    bitlist_size = (
+        spec_deneb.SYNC_COMMITTEE_SIZE // spec_deneb.SYNC_COMMITTEE_SUBNET_COUNT
+    )
+    bitvector_type = Bitvector[bitlist_size]
 
-        if all(isinstance(n, Exception) for n in numbers_of_root_matching_indices):
-            with pytest.raises(
-                RuntimeError,
-                match="Failed to get a response from all beacon nodes",
-            ):
-                _ = await multi_beacon_node_three_inited_nodes.get_sync_committee_contribution(
-                    slot=123,
-                    subcommittee_index=1,
-                    beacon_block_root="0x" + os.urandom(32).hex(),
-                )
+    for number_of_root_matching_indices in numbers_of_root_matching_indices:
+        if isinstance(number_of_root_matching_indices, int):
+            agg_bits_to_return = bitvector_type(
+                [True] * number_of_root_matching_indices
+                + [False] * (bitlist_size - number_of_root_matching_indices)
+            )
+            mocked_responses.get(
+                url=_SYNC_COMMITTEE_CONTRIBUTION_URL_RE,
+                payload=dict(
+                    data=SpecSyncCommittee.Contribution(
+                        aggregation_bits=agg_bits_to_return,
+                    ).to_obj(),
+                ),
+            )
+        elif isinstance(number_of_root_matching_indices, Exception):
+            mocked_responses.get(
+                url=_SYNC_COMMITTEE_CONTRIBUTION_URL_RE,
+                exception=number_of_root_matching_indices,
+            )
         else:
-            returned_contribution = await multi_beacon_node_three_inited_nodes.get_sync_committee_contribution(
+            raise NotImplementedError
+
+    if all(isinstance(n, Exception) for n in numbers_of_root_matching_indices):
+        with pytest.raises(
+            RuntimeError,
+            match="Failed to get a response from all beacon nodes",
+        ):
+            _ = await multi_beacon_node_three_inited_nodes.get_sync_committee_contribution(
                 slot=123,
                 subcommittee_index=1,
-                beacon_block_root="0x" + os.urandom(32).hex(),
+                beacon_block_root=_BEACON_BLOCK_ROOT,
             )
-            assert (
-                sum(returned_contribution.aggregation_bits) == best_contribution_score
+    else:
+        returned_contribution = (
+            await multi_beacon_node_three_inited_nodes.get_sync_committee_contribution(
+                slot=123,
+                subcommittee_index=1,
+                beacon_block_root=_BEACON_BLOCK_ROOT,
             )
+        )
+        assert sum(returned_contribution.aggregation_bits) == best_contribution_score
@@ -5,17 +5,55 @@ when multiple beacon nodes are provided to it. That includes:
 
 import asyncio
 import re
-from functools import partial
+from collections.abc import Awaitable, Callable
+from functools import cache
 from typing import Any, TypedDict
 
-import msgspec.json
+import msgspec
 import pytest
 from aiohttp.web_exceptions import HTTPRequestTimeout
 from aioresponses import CallbackResult, aioresponses
+from yarl import URL
 
 from providers import MultiBeaconNode
 from schemas import SchemaBeaconAPI
-from spec import SpecBeaconBlock
+from tests.mock_api.beacon_node import _json_encoder
+
+
+@cache
+def _produce_block_v3_url_re(host: str) -> re.Pattern[str]:
+    return re.compile(rf"^http://{host}:1234/eth/v3/validator/blocks/\d+")
+
+
+@cache
+def _block_response(
+    execution_payload_value: int,
+    consensus_block_value: int,
+) -> SchemaBeaconAPI.ProduceBlockV3Response:
+    return SchemaBeaconAPI.ProduceBlockV3Response(
+        version=SchemaBeaconAPI.BeaconBlockVersion.DENEB,
+        execution_payload_blinded=False,
+        execution_payload_value=str(execution_payload_value),
+        consensus_block_value=str(consensus_block_value),
+        data=dict(),
+    )
+
+
+def _produce_block_v3_callback(
+    body: bytes | None,
+    exception: Exception | None,
+    delay: float,
+) -> Callable[..., Awaitable[CallbackResult]]:
+    async def _callback(url: URL, **kwargs: Any) -> CallbackResult:
+        if delay:
+            await asyncio.sleep(delay)
+        if exception:
+            raise exception
+        if body:
+            return CallbackResult(body=body)
+        raise ValueError("No exception or response to return")
+
+    return _callback
 
 
 class BeaconNodeResponse(TypedDict):
@@ -29,292 +67,102 @@ class BeaconNodeResponseSequence(TypedDict):
     responses: list[BeaconNodeResponse]
 
 
+def _block(
+    execution_payload_value: int,
+    consensus_block_value: int,
+    delay: float = 0,
+) -> BeaconNodeResponse:
+    return BeaconNodeResponse(
+        response=_block_response(execution_payload_value, consensus_block_value),
+        exception=None,
+        delay=delay,
+    )
+
+
+def _timeout() -> BeaconNodeResponse:
+    return BeaconNodeResponse(
+        response=None,
+        exception=HTTPRequestTimeout(),
+        delay=0,
+    )
+
+
+def _bn_response_sequences(
+    *responses: BeaconNodeResponse,
+) -> list[BeaconNodeResponseSequence]:
+    # One response per beacon node, in the order of the mocked hosts
+    return [
+        BeaconNodeResponseSequence(host=host, responses=[response])
+        for host, response in zip(
+            ("beacon-node-a", "beacon-node-b", "beacon-node-c"),
+            responses,
+            strict=True,
+        )
+    ]
+
+
 @pytest.mark.parametrize(
     argnames=("bn_response_sequences", "returned_block_value"),
     argvalues=[
         pytest.param(
-            [
-                dict(
-                    host="beacon-node-a",
-                    responses=[
-                        BeaconNodeResponse(
-                            response=SchemaBeaconAPI.ProduceBlockV3Response(
-                                version=SchemaBeaconAPI.BeaconBlockVersion.DENEB,
-                                execution_payload_blinded=False,
-                                execution_payload_value=str(100),
-                                consensus_block_value=str(50),
-                                data=dict(),
-                            ),
-                            exception=None,
-                            delay=0,
-                        ),
-                    ],
-                ),
-                dict(
-                    host="beacon-node-b",
-                    responses=[
-                        BeaconNodeResponse(
-                            response=SchemaBeaconAPI.ProduceBlockV3Response(
-                                version=SchemaBeaconAPI.BeaconBlockVersion.DENEB,
-                                execution_payload_blinded=False,
-                                execution_payload_value=str(150),
-                                consensus_block_value=str(50),
-                                data=dict(),
-                            ),
-                            exception=None,
-                            delay=0,
-                        ),
-                    ],
-                ),
-                dict(
-                    host="beacon-node-c",
-                    responses=[
-                        BeaconNodeResponse(
-                            response=SchemaBeaconAPI.ProduceBlockV3Response(
-                                version=SchemaBeaconAPI.BeaconBlockVersion.DENEB,
-                                execution_payload_blinded=False,
-                                execution_payload_value=str(120),
-                                consensus_block_value=str(50),
-                                data=dict(),
-                            ),
-                            exception=None,
-                            delay=0,
-                        ),
-                    ],
-                ),
-            ],
+            _bn_response_sequences(_block(100, 50), _block(150, 50), _block(120, 50)),
             200,
             id="Happy path - blocks returned from all beacon nodes",
         ),
         pytest.param(
-            [
-                dict(
-                    host="beacon-node-a",
-                    responses=[
-                        BeaconNodeResponse(
-                            response=SchemaBeaconAPI.ProduceBlockV3Response(
-                                version=SchemaBeaconAPI.BeaconBlockVersion.DENEB,
-                                execution_payload_blinded=False,
-                                execution_payload_value=str(100),
-                                consensus_block_value=str(50),
-                                data=dict(),
-                            ),
-                            exception=None,
-                            delay=0,
-                        ),
-                    ],
-                ),
-                dict(
-                    host="beacon-node-b",
-                    responses=[
-                        BeaconNodeResponse(
-                            response=SchemaBeaconAPI.ProduceBlockV3Response(
-                                version=SchemaBeaconAPI.BeaconBlockVersion.DENEB,
-                                execution_payload_blinded=False,
-                                execution_payload_value=str(150),
-                                consensus_block_value=str(50),
-                                data=dict(),
-                            ),
-                            exception=None,
-                            delay=0,
-                        ),
-                    ],
-                ),
-                dict(
-                    host="beacon-node-c",
-                    responses=[
-                        BeaconNodeResponse(
-                            response=None,
-                            exception=HTTPRequestTimeout(),
-                            delay=0,
-                        ),
-                    ],
-                ),
-            ],
+            _bn_response_sequences(_block(100, 50), _block(150, 50), _timeout()),
             200,
             id="2/3 blocks returned, 1 request timeout",
         ),
         pytest.param(
-            [
-                dict(
-                    host="beacon-node-a",
-                    responses=[
-                        BeaconNodeResponse(
-                            response=SchemaBeaconAPI.ProduceBlockV3Response(
-                                version=SchemaBeaconAPI.BeaconBlockVersion.DENEB,
-                                execution_payload_blinded=False,
-                                execution_payload_value=str(100),
-                                consensus_block_value=str(50),
-                                data=dict(),
-                            ),
-                            exception=None,
-                            delay=0,
-                        ),
-                    ],
-                ),
-                dict(
-                    host="beacon-node-b",
-                    responses=[
-                        BeaconNodeResponse(
-                            response=None,
-                            exception=HTTPRequestTimeout(),
-                            delay=0,
-                        ),
-                    ],
-                ),
-                dict(
-                    host="beacon-node-c",
-                    responses=[
-                        BeaconNodeResponse(
-                            response=None,
-                            exception=HTTPRequestTimeout(),
-                            delay=0,
-                        ),
-                    ],
-                ),
-            ],
+            _bn_response_sequences(_block(100, 50), _timeout(), _timeout()),
             150,
             id="1/3 blocks returned, 2 requests time out",
         ),
         pytest.param(
-            [
-                dict(
-                    host="beacon-node-a",
-                    responses=[
-                        BeaconNodeResponse(
-                            response=None,
-                            exception=HTTPRequestTimeout(),
-                            delay=0,
-                        ),
-                    ],
-                ),
-                dict(
-                    host="beacon-node-b",
-                    responses=[
-                        BeaconNodeResponse(
-                            response=None,
-                            exception=HTTPRequestTimeout(),
-                            delay=0,
-                        ),
-                    ],
-                ),
-                dict(
-                    host="beacon-node-c",
-                    responses=[
-                        BeaconNodeResponse(
-                            response=None,
-                            exception=HTTPRequestTimeout(),
-                            delay=0,
-                        ),
-                    ],
-                ),
-            ],
+            _bn_response_sequences(_timeout(), _timeout(), _timeout()),
             0,
             id="No blocks returned -> produce_block_v3 raises an Exception",
         ),
         pytest.param(
-            [
-                dict(
-                    host="beacon-node-a",
-                    responses=[
-                        BeaconNodeResponse(
-                            response=SchemaBeaconAPI.ProduceBlockV3Response(
-                                version=SchemaBeaconAPI.BeaconBlockVersion.DENEB,
-                                execution_payload_blinded=False,
-                                execution_payload_value=str(150),
-                                consensus_block_value=str(50),
-                                data=dict(),
-                            ),
-                            exception=None,
-                            delay=0.05,
-                        ),
-                    ],
-                ),
-                dict(
-                    host="beacon-node-b",
-                    responses=[
-                        BeaconNodeResponse(
-                            response=SchemaBeaconAPI.ProduceBlockV3Response(
-                                version=SchemaBeaconAPI.BeaconBlockVersion.DENEB,
-                                execution_payload_blinded=False,
-                                execution_payload_value=str(200),
-                                consensus_block_value=str(50),
-                                data=dict(),
-                            ),
-                            exception=None,
-                            delay=0.06,
-                        ),
-                    ],
-                ),
-                dict(
-                    host="beacon-node-c",
-                    responses=[
-                        BeaconNodeResponse(
-                            response=SchemaBeaconAPI.ProduceBlockV3Response(
-                                version=SchemaBeaconAPI.BeaconBlockVersion.DENEB,
-                                execution_payload_blinded=False,
-                                execution_payload_value=str(1000),
-                                consensus_block_value=str(500),
-                                data=dict(),
-                            ),
-                            exception=None,
-                            delay=0.2,
-                        ),
-                    ],
-                ),
-            ],
+            _bn_response_sequences(
+                _block(150, 50, delay=0.05),
+                _block(200, 50, delay=0.06),
+                _block(1000, 500, delay=0.2),
+            ),
             250,
             id="2 fast responses and 1 delayed - we do not wait for the delayed one",
         ),
     ],
 )
-@pytest.mark.usefixtures("_beacon_block_class_init")
 async def test_produce_block_v3(
     bn_response_sequences: list[BeaconNodeResponseSequence],
     returned_block_value: int,
     multi_beacon_node_three_inited_nodes: MultiBeaconNode,
+    empty_beacon_block: dict,  # type: ignore[type-arg]
 ) -> None:
     """Tests that the multi-beacon requests blocks from all beacon nodes
     and returns the one with the highest value.
     """
-    _empty_beacon_block = SpecBeaconBlock.Deneb().to_obj()
-
     with aioresponses() as m:
         for sequence in bn_response_sequences:
-            bn_host = sequence["host"]
-            url_regex_to_mock = re.compile(
-                rf"^http://{bn_host}:1234/eth/v3/validator/blocks/\d+",
-            )
+            url_regex_to_mock = _produce_block_v3_url_re(sequence["host"])
 
             for r in sequence["responses"]:
                 response, exception, delay = r["response"], r["exception"], r["delay"]
 
+                body = None
                 if response:
-                    response.data["block"] = _empty_beacon_block
+                    body = _json_encoder.encode(
+                        msgspec.structs.replace(
+                            response,
+                            data={**response.data, "block": empty_beacon_block},
+                        )
+                    )
 
-                async def _f(
-                    _response: SchemaBeaconAPI.ProduceBlockV3Response | None,
-                    _exception: Exception | None,
-                    _delay: float,
-                    *args: Any,
-                    **kwargs: Any,
-                ) -> CallbackResult:
-                    await asyncio.sleep(_delay)
-                    if _exception:
-                        raise _exception
-                    if _response:
-                        return CallbackResult(body=msgspec.json.encode(_response))
-                    raise ValueError("No exception or response to return")
-
-                _callback = partial(
-                    _f,
-                    response,
-                    exception,
-                    delay,
-                )
                 m.get(
                     url=url_regex_to_mock,
-                    callback=_callback,
+                    callback=_produce_block_v3_callback(body, exception, delay),
                 )
 
         success_expected = any(
@@ -324,12 +172,26 @@ async def test_produce_block_v3(
         )
 
         if success_expected:
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
             result = await multi_beacon_node_three_inited_nodes.produce_block_v3(
                 slot=1,
                 graffiti=b"test_produce_block_v3",
                 builder_boost_factor=90,
                 randao_reveal="randao",
             )
+            elapsed = loop.time() - start_time
+
+            # We should not wait for the slowest beacon node to respond
+            # once the block production timeout is reached
+            slowest_response_delay = max(
+                response["delay"]
+                for sequence in bn_response_sequences
+                for response in sequence["responses"]
+            )
+            if slowest_response_delay > 0:
+                assert elapsed < slowest_response_delay
+
             (
                 block,
                 full_response,
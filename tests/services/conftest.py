@@ -1,3 +1,6 @@
+import datetime
+from math import floor
+
 import pytest
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
@@ -24,7 +27,7 @@ def validator_duty_service_options(
     task_manager: TaskManager,
     cli_args: CLIArgs,
 ) -> ValidatorDutyServiceOptions:
-    return dict(
+    return ValidatorDutyServiceOptions(
         multi_beacon_node=multi_beacon_node,
         beacon_chain=beacon_chain,
         spec=spec_deneb,
@@ -48,3 +51,32 @@ def block_proposal_service(
     validator_duty_service_options: ValidatorDutyServiceOptions,
 ) -> BlockProposalService:
     return BlockProposalService(**validator_duty_service_options)
+
+
+@pytest.fixture
+def started_slot(beacon_chain: BeaconChain, monkeypatch: pytest.MonkeyPatch) -> int:
+    """Seeds the beacon chain clock so that the next slot starts right now,
+    instead of waiting for it to start in real time.
+
+    Returns the number of the slot that just started.
+    """
+    slot = beacon_chain.current_slot + 1
+    slot_start = datetime.datetime.now(tz=datetime.UTC)
+    seconds_per_slot = int(beacon_chain.spec.SECONDS_PER_SLOT)
+
+    def _get_datetime_for_slot(_slot: int) -> datetime.datetime:
+        return slot_start + datetime.timedelta(
+            seconds=(_slot - slot) * seconds_per_slot
+        )
+
+    def _get_slots_since_genesis() -> int:
+        seconds_elapsed = (
+            datetime.datetime.now(tz=datetime.UTC) - slot_start
+        ).total_seconds()
+        return slot + floor(seconds_elapsed / seconds_per_slot)
+
+    monkeypatch.setattr(beacon_chain, "get_datetime_for_slot", _get_datetime_for_slot)
+    monkeypatch.setattr(
+        beacon_chain, "_get_slots_since_genesis", _get_slots_since_genesis
+    )
+    return slot
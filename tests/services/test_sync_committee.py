@@ -13,6 +13,9 @@ from services.sync_committee import (
 from services.validator_duty_service import ValidatorDutyServiceOptions
 from spec.base import SpecDeneb
 
+_SELECTION_PROOF = os.urandom(96)
+_BEACON_BLOCK_ROOT = "0x" + os.urandom(32).hex()
+
 
 @pytest.fixture
 def sync_committee_service(
@@ -55,7 +58,7 @@ async def test_produce_sync_message_if_not_yet_produced(
         duty_slot=duty_slot,
     )
 
-    assert any("Published sync committee messages" in m for m in caplog.messages)
+    assert "Published sync committee messages" in caplog.text
     assert (
         _VC_PUBLISHED_SYNC_COMMITTEE_MESSAGES._value.get()
         == sync_messages_published_before + 1
@@ -84,7 +87,7 @@ async def test_aggregate_sync_messages(
                     slot=duty_slot + 1,
                     subcommittee_index=subcommittee_index,
                     is_aggregator=True,
-                    selection_proof=os.urandom(96),
+                    selection_proof=_SELECTION_PROOF,
                 )
                 for subcommittee_index in range(5)
             ],
@@ -96,13 +99,11 @@ async def test_aggregate_sync_messages(
     )
     await sync_committee_service.aggregate_sync_messages(
         duty_slot=duty_slot,
-        beacon_block_root="0x" + os.urandom(32).hex(),
+        beacon_block_root=_BEACON_BLOCK_ROOT,
         duties_with_proofs=duties_with_proofs,
     )
 
-    assert any(
-        "Published sync committee contribution and proofs" in m for m in caplog.messages
-    )
+    assert "Published sync committee contribution and proofs" in caplog.text
     assert (
         _VC_PUBLISHED_SYNC_COMMITTEE_CONTRIBUTIONS._value.get()
         > contributions_produced_before
@@ -94,14 +94,14 @@ async def test_handle_slashing_event(
         if isinstance(event, SchemaBeaconAPI.AttesterSlashingEvent)
         else "proposer"
     )
-    assert any(f"Processed {event_type} slashing event" in m for m in caplog.messages)
+    assert f"Processed {event_type} slashing event" in caplog.text
 
     if not our_validator_affected:
         assert validator_status_tracker.slashing_detected is False
         assert _SLASHING_DETECTED._value.get() == 0
 
     if our_validator_affected:
-        assert any("Slashing detected" in m for m in caplog.messages)
+        assert "Slashing detected" in caplog.text
         assert any(record.levelname == "CRITICAL" for record in caplog.records)
 
         # ValidatorStatusTracker property value should be set